@@ -1,32 +1,83 @@
+import asyncio
 import re
-import difflib
+import socket
+import sys
 import threading
 import time
-from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from html import unescape
 from urllib.parse import unquote, quote_plus
 
+import httpx
+import orjson
+from rapidfuzz import fuzz, process as fuzz_process
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 
-from cachetools import cached, TTLCache
+from cachetools import cached, LRUCache, TTLCache
+from cachetools.keys import hashkey
+
+class OrjsonProvider(JSONProvider):
+    """jsonify via orjson — serializes straight to UTF-8 bytes instead
+    of going through the stdlib encoder and a str->bytes pass."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # CORS: allow all origins by default (or lock down to your GH Pages origin later)
 CORS(app)
 
+# Compress JSON responses (movie lists compress ~3x); brotli level 4
+# beats gzip on both speed and ratio for payloads this size.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+Compress(app)
+
 # ----------------- CONFIG -----------------
-LANGUAGE_CODES = {
-    "tamil": "tamil",
-    "hindi": "hindi",
-    "telugu": "telugu",
-    "malayalam": "malayalam",
-    "kannada": "kannada",
-    "bengali": "bengali",
-    "marathi": "marathi",
-    "punjabi": "punjabi",
+# The einthusan lang code is just the lowercase language name, so a
+# set is all the "mapping" we need: membership check, then use the
+# name directly.
+LANGUAGES = frozenset({
+    "tamil",
+    "hindi",
+    "telugu",
+    "malayalam",
+    "kannada",
+    "bengali",
+    "marathi",
+    "punjabi",
+})
+# Stable ordering for fuzzy-match candidates.
+LANGUAGE_CHOICES = tuple(sorted(LANGUAGES))
+
+# Per-language URL templates resolved once at import; the hot paths
+# only substitute the page number / query instead of re-interpolating
+# the whole URL per request.
+RECENT_URLS = {
+    lang: f"https://einthusan.tv/movie/results/?find=Recent&lang={lang}&page=%d"
+    for lang in LANGUAGE_CHOICES
+}
+POPULAR_URLS = {
+    lang: f"https://einthusan.tv/movie/results/?find=Popularity&lang={lang}&ptype=view&tp=alltime&page=%d"
+    for lang in LANGUAGE_CHOICES
+}
+SEARCH_URLS = {
+    lang: f"https://einthusan.tv/movie/results/?lang={lang}&query=%s"
+    for lang in LANGUAGE_CHOICES
 }
 
 SESSION = requests.Session()
@@ -37,115 +88,333 @@ SESSION.headers.update({
         "Chrome/124.0.0.0 Safari/537.36"
     ),
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
 })
 
+# Everything goes to einthusan.tv, so a big keep-alive pool avoids
+# paying the TCP+TLS handshake on every fetch (the default pool of 10
+# would throttle the fallback-title thread pool).
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 REQUEST_TIMEOUT = 8  # seconds
+# Einthusan pages are ~100-200 KB; anything past this is not a page we
+# want to hold in memory (or cache).
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Cache DNS answers for a few minutes. We only ever talk to
+# einthusan.tv and its CDN, and a fresh getaddrinfo on every cold
+# connection adds tens of milliseconds for no reason.
+_orig_getaddrinfo = socket.getaddrinfo
+_dns_cache = TTLCache(maxsize=64, ttl=300)
+_dns_cache_lock = threading.RLock()
+
+def _cached_getaddrinfo(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    with _dns_cache_lock:
+        hit = _dns_cache.get(key)
+    if hit is not None:
+        return hit
+    result = _orig_getaddrinfo(*args, **kwargs)
+    with _dns_cache_lock:
+        _dns_cache[key] = result
+    return result
+
+socket.getaddrinfo = _cached_getaddrinfo
 
 # UPDATED: We're adding a new, more comprehensive pattern to handle
 # the "language in HD - Einthusan" case more effectively, and re-ordering
 # the patterns to ensure the most specific ones are checked first.
+# Every replacement is a deletion, so the patterns are merged into a
+# single alternation and stripped out in one pass instead of one
+# pattern.sub() scan per entry.
 TITLE_PATTERNS = [
     # This new pattern is designed to catch the language, quality, and site name
     # in various formats, with or without a year.
-    (re.compile(r'\s*\(\d{4}\)\s*(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$', re.IGNORECASE), ''),
-    (re.compile(r'\s*\(\d{4}\)\s*(?:(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*(?:,)?\s*)+\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$', re.IGNORECASE), ''),
-    (re.compile(r'\s*(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$', re.IGNORECASE), ''),
-    (re.compile(r'^Einthusan\s*[-–—]\s*', re.IGNORECASE), ''),
-    (re.compile(r'\s*\(\d{4}\)\s*$'), ''),
-    (re.compile(r'\s*\[(Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\]', re.IGNORECASE), ''),
-    (re.compile(r'\|\s*Einthusan.*$', re.IGNORECASE), ''),
-    (re.compile(r'Watch Full Movie Online Free$', re.IGNORECASE), ''),
-    (re.compile(r'Online Watch Free (?:HD|SD)$', re.IGNORECASE), ''),
-    (re.compile(r'Free Movies Online$', re.IGNORECASE), ''),
+    r'\s*\(\d{4}\)\s*(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$',
+    r'\s*\(\d{4}\)\s*(?:(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*(?:,)?\s*)+\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$',
+    r'\s*(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\s*in\s*(?:HD|SD)\s*-\s*Einthusan.*$',
+    r'^Einthusan\s*[-–—]\s*',
+    r'\s*\(\d{4}\)\s*$',
+    r'\s*\[(?:Tamil|Hindi|Telugu|Malayalam|Kannada|Bengali|Marathi|Punjabi)\]',
+    r'\|\s*Einthusan.*$',
+    r'Watch Full Movie Online Free$',
+    r'Online Watch Free (?:HD|SD)$',
+    r'Free Movies Online$',
 ]
 
+# The third-party `regex` engine handles big literal alternations like
+# this one noticeably faster than stdlib `re`; fall back to `re` when
+# it isn't installed (the pattern is valid for both).
+try:
+    import regex as _regex
+    TITLE_CLEAN_RE = _regex.compile('|'.join(f'(?:{p})' for p in TITLE_PATTERNS), _regex.IGNORECASE)
+except ImportError:
+    TITLE_CLEAN_RE = re.compile('|'.join(f'(?:{p})' for p in TITLE_PATTERNS), re.IGNORECASE)
+
+# Bound methods of the hot patterns: skips the attribute lookup on
+# every call in the per-title loops.
+TITLE_CLEAN_SUB = TITLE_CLEAN_RE.sub
+
+
+# Limits for the async client used for the fallback title fetches;
+# HTTP/2 lets all of them multiplex over a couple of connections.
+ASYNC_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
 # --- CACHE CONFIG ---
-fetch_page_cache = TTLCache(maxsize=256, ttl=432000)
-search_movie_cache = TTLCache(maxsize=128, ttl=432000)
+# Movie pages are effectively immutable, so they can live for days;
+# listing/search pages churn as new movies land, so they get a short
+# TTL. Each cache is bounded and has its own lock (the fallback-title
+# fetcher and the thread pool hit these concurrently). fetch_page and
+# fetch_movies_by_url used to share one cache, which meant the same URL
+# key could hold either raw bytes or a parsed list depending on which
+# function wrote last.
+page_cache = TTLCache(maxsize=512, ttl=432000)
+# Raw bytes of listing/search pages. Matching the parsed listing
+# cache's one-hour TTL is what makes that TTL real: once both expire,
+# the re-scrape actually hits the network (or a 304 revalidation)
+# instead of reparsing five-day-old bytes.
+listing_page_cache = TTLCache(maxsize=256, ttl=3600)
+page_cache_lock = threading.RLock()
+# ETag/Last-Modified validators plus the last good body, kept beyond
+# the TTL so an expired page can be revalidated with a conditional GET
+# (a 304 skips the whole body download) instead of refetched.
+page_validators = LRUCache(maxsize=512)
+# Failed fetches are remembered briefly so a broken URL costs one dict
+# lookup instead of a multi-second timeout for every caller behind it.
+negative_cache = TTLCache(maxsize=1024, ttl=30)
+negative_cache_lock = threading.RLock()
+listing_cache = TTLCache(maxsize=256, ttl=3600)
+listing_cache_lock = threading.RLock()
+# Last good copy of each listing, kept past the TTL so an upstream
+# outage degrades to slightly stale data instead of an empty page.
+listing_last_good = LRUCache(maxsize=256)
+search_movie_cache = TTLCache(maxsize=128, ttl=3600)
+search_movie_cache_lock = threading.RLock()
+# Extracted results per movie page, so a cache hit skips the parse /
+# regex scan too, not just the fetch. Only successful extractions are
+# stored — failures stay retryable.
+title_cache = TTLCache(maxsize=512, ttl=432000)
+video_url_cache = TTLCache(maxsize=512, ttl=432000)
+extract_cache_lock = threading.RLock()
 
 # ----------------- HELPERS -----------------
-@cached(cache=TTLCache(maxsize=128, ttl=86400))
+def _build_typo_map() -> dict[str, str]:
+    """Map every string within edit distance 1 of a language name back
+    to that name, so the common case is a single dict lookup."""
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    typo_map = {}
+    for name in LANGUAGE_CHOICES:
+        typo_map[name] = name
+    for name in LANGUAGE_CHOICES:
+        for i in range(len(name) + 1):
+            head, tail = name[:i], name[i:]
+            if tail:
+                typo_map.setdefault(head + tail[1:], name)  # deletion
+                for c in letters:
+                    typo_map.setdefault(head + c + tail[1:], name)  # substitution
+            if len(tail) > 1:
+                typo_map.setdefault(head + tail[1] + tail[0] + tail[2:], name)  # transposition
+            for c in letters:
+                typo_map.setdefault(head + c + tail, name)  # insertion
+
+    return typo_map
+
+TYPO_MAP = _build_typo_map()
+
 def correct_spelling(user_input: str):
     """Fuzzy match a language key."""
-    options = tuple(LANGUAGE_CODES.keys())
-    match = difflib.get_close_matches((user_input or "").lower(), options, n=1, cutoff=0.7)
-    return match[0] if match else None
+    s = (user_input or "").lower().strip()
+    match = TYPO_MAP.get(s)
+    if match:
+        return match
+    # Messier typos (two edits, truncations) go through rapidfuzz.
+    result = fuzz_process.extractOne(
+        s, LANGUAGE_CHOICES, score_cutoff=70, scorer=fuzz.ratio
+    )
+    return result[0] if result else None
 
 def clean_title(title: str | None) -> str | None:
     if not title:
         return None
-    title = title.strip()
-    for pattern, repl in TITLE_PATTERNS:
-        title = pattern.sub(repl, title)
-    return title.strip()
+    # Run the combined sub to a fixpoint: the old sequential passes
+    # cascaded (stripping one suffix exposed another, e.g. "(2022)"
+    # before "Watch Full Movie Online Free"), and a single pass misses
+    # those. Real titles converge in two or three rounds.
+    cleaned = title
+    while True:
+        new = TITLE_CLEAN_SUB('', cleaned)
+        if new == cleaned:
+            break
+        cleaned = new
+    cleaned = cleaned.strip()
+    # The same titles come back over and over (listing candidates,
+    # cache keys); interning collapses the copies and makes later dict
+    # lookups pointer comparisons.
+    return sys.intern(cleaned) if cleaned else cleaned
+
+# 2-8 alphanumerics that either contain a digit (but aren't all
+# digits, so titles like "96" pass through) or are vowel-free letters.
+CODE_LIKE_RE = re.compile(
+    r'(?!\d+$)(?:(?=[A-Za-z0-9]*\d)[A-Za-z0-9]{2,8}|[B-DF-HJ-NP-TV-Zb-df-hj-np-tv-z]{2,8})'
+)
+CODE_LIKE_FULLMATCH = CODE_LIKE_RE.fullmatch
 
 def looks_like_code(s: str | None) -> bool:
     """Detect short alphanumeric codes like '53BA', '1S2Q', 'MukD' etc.
-    This version correctly ignores titles that are purely numbers, like "96"."""
+    One regex pass instead of the old split/fullmatch/scan pipeline."""
     if not s:
         return False
-    s2 = s.strip()
-    if not s2:
-        return False
-    if s2.isdigit():
-        return False
-    one_token = len(s2.split()) == 1
-    simple = re.fullmatch(r'[A-Za-z0-9]+', s2) is not None
-    shortish = 2 <= len(s2) <= 8
-    has_digit = any(ch.isdigit() for ch in s2)
-    alpha = ''.join(ch for ch in s2 if ch.isalpha())
-    no_vowel = not re.search(r'[AEIOUaeiou]', alpha) if alpha else False
-    return one_token and simple and shortish and (has_digit or no_vowel)
-
-@cached(cache=fetch_page_cache)
-def fetch_page(url: str) -> bytes | None:
+    return CODE_LIKE_FULLMATCH(s.strip()) is not None
+
+def fetch_page(url: str, cache: TTLCache = page_cache) -> bytes | None:
+    key = hashkey(url)
+    with page_cache_lock:
+        body = cache.get(key)
+        validators = page_validators.get(url)
+    if body is not None:
+        return body
+    with negative_cache_lock:
+        if url in negative_cache:
+            return None
+
+    # Past the TTL: revalidate conditionally if we still have validators
+    # for this URL, so an unchanged page costs a 304 with no body.
+    headers = {}
+    if validators:
+        etag, last_modified, _ = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
     try:
-        resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        resp = SESSION.get(url, timeout=REQUEST_TIMEOUT, headers=headers, stream=True)
+        if resp.status_code == 304 and validators:
+            resp.close()
+            body = validators[2]
+            with page_cache_lock:
+                cache[key] = body
+            return body
         resp.raise_for_status()
-        return resp.content
+        # Stream with a hard cap instead of one giant .content read, so
+        # an oversized (or hostile) response can't balloon memory.
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+            if len(buf) > MAX_PAGE_BYTES:
+                resp.close()
+                with negative_cache_lock:
+                    negative_cache[url] = True
+                return None
     except requests.RequestException:
+        with negative_cache_lock:
+            negative_cache[url] = True
         return None
 
-def try_extract_title_from_dom(soup: BeautifulSoup) -> str | None:
-    meta = soup.find('meta', property='og:title')
-    if meta and meta.get('content'):
-        cleaned = clean_title(meta['content'])
-        if cleaned:
-            return cleaned
-    if soup.title and soup.title.text:
-        cleaned = clean_title(soup.title.text)
-        if cleaned:
-            return cleaned
-    h1 = soup.find('h1')
-    if h1 and h1.text:
-        cleaned = clean_title(h1.text)
-        if cleaned:
-            return cleaned
+    body = bytes(buf)
+    with page_cache_lock:
+        cache[key] = body
+        page_validators[url] = (resp.headers.get('ETag'), resp.headers.get('Last-Modified'), body)
+    return body
+
+# Movie pages only need three small fields, so precompiled regexes
+# over the raw bytes replace building a tree per page. Priority order
+# stays og:title -> <title> -> <h1>.
+OG_TITLE_RE = re.compile(rb'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)', re.IGNORECASE)
+TITLE_TAG_RE = re.compile(rb'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+H1_RE = re.compile(rb'<h1[^>]*>([^<]+)</h1>', re.IGNORECASE)
+
+def extract_title_from_content(content: bytes) -> str | None:
+    # The substring guard (C memchr scan) keeps pages without og:title
+    # out of the regex engine entirely.
+    if b'og:title' in content:
+        m = OG_TITLE_RE.search(content)
+        if m:
+            cleaned = clean_title(unescape(m.group(1).decode('utf-8', 'replace')))
+            if cleaned:
+                return cleaned
+    for pattern in (TITLE_TAG_RE, H1_RE):
+        m = pattern.search(content)
+        if m:
+            cleaned = clean_title(unescape(m.group(1).decode('utf-8', 'replace')))
+            if cleaned:
+                return cleaned
     return None
 
 def get_title_from_movie_page(page_url: str) -> str | None:
+    with extract_cache_lock:
+        hit = title_cache.get(page_url)
+    if hit is not None:
+        return hit
     content = fetch_page(page_url)
     if not content:
         return None
-    soup = BeautifulSoup(content, 'html.parser')
-    return try_extract_title_from_dom(soup)
-
-def process_movie_block(div) -> dict | None:
-    a = div.find('a')
-    img = div.find('img')
-    title_div = div.find('div', class_='title')
+    title = extract_title_from_content(content)
+    if title:
+        with extract_cache_lock:
+            title_cache[page_url] = title
+    return title
+
+async def _fetch_fallback_titles(urls: list[str]) -> list[str | None]:
+    """Fetch a batch of movie pages concurrently and extract their titles.
+
+    The pages are also dropped into page_cache so a later /watch on the
+    same movie doesn't refetch them."""
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=ASYNC_LIMITS,
+        timeout=REQUEST_TIMEOUT,
+        headers=dict(SESSION.headers),
+    ) as client:
+        async def fetch_one(url: str) -> str | None:
+            try:
+                resp = await client.get(url, follow_redirects=True)
+                resp.raise_for_status()
+            except httpx.HTTPError:
+                return None
+            # Honour the same size cap as fetch_page; an oversized page
+            # is treated as a miss rather than pinned in the cache.
+            if len(resp.content) > MAX_PAGE_BYTES:
+                return None
+            with page_cache_lock:
+                page_cache[hashkey(url)] = resp.content
+            return extract_title_from_content(resp.content)
+
+        return await asyncio.gather(*(fetch_one(u) for u in urls))
+
+def process_movie_block(div) -> tuple[dict, bool] | None:
+    """Extract one movie entry from a selectolax `div.block1` node.
+
+    Returns the movie dict plus a flag saying whether the title still
+    needs the (slow) movie-page fallback fetch; the caller batches
+    those fetches instead of doing them inline."""
+    a = div.css_first('a')
+    img = div.css_first('img')
+    title_div = div.css_first('div.title')
     if not (a and img):
         return None
 
-    page_url_full = f"https://einthusan.tv{a.get('href','')}"
+    # Read the attribute dicts once; each .attributes call crosses into
+    # the C node and rebuilds the dict.
+    img_attrs = img.attributes
+    page_url_full = f"https://einthusan.tv{a.attributes.get('href') or ''}"
 
     candidates = []
-    if title_div and title_div.text:
-        candidates.append(title_div.text.strip())
-    if img and img.get('alt'):
-        candidates.append(img.get('alt').strip())
-    if img and img.get('title'):
-        candidates.append(img.get('title').strip())
+    if title_div:
+        text = title_div.text(strip=True)
+        if text:
+            candidates.append(text)
+    alt = img_attrs.get('alt')
+    if alt:
+        candidates.append(alt.strip())
+    img_title = img_attrs.get('title')
+    if img_title:
+        candidates.append(img_title.strip())
 
     title = None
     for c in candidates:
@@ -154,60 +423,146 @@ def process_movie_block(div) -> dict | None:
             title = cleaned
             break
 
-    if not title or len(title) < 3 or looks_like_code(title):
-        t = get_title_from_movie_page(page_url_full)
-        if t:
-            title = t
-        else:
-            title = "Untitled Movie"
+    needs_fallback = not title or len(title) < 3 or looks_like_code(title)
 
-    img_url = img.get('src') or img.get('data-src') or img.get('data-original') or ''
+    img_url = img_attrs.get('src') or img_attrs.get('data-src') or img_attrs.get('data-original') or ''
     if img_url.startswith('//'):
         img_url = 'https:' + img_url
 
-    return {"title": title, "img_url": img_url, "page_url": page_url_full}
+    return {"title": title, "img_url": img_url, "page_url": page_url_full}, needs_fallback
 
-@cached(cache=fetch_page_cache)
-def fetch_movies_by_url(url: str) -> list[dict]:
-    content = fetch_page(url)
+def _scrape_movie_listing(url: str) -> list[dict] | None:
+    """Fetch and parse one listing page; None means the fetch failed
+    (as opposed to a page that genuinely has no movies)."""
+    content = fetch_page(url, cache=listing_page_cache)
     if not content:
-        return []
-    soup = BeautifulSoup(content, 'html.parser')
-    blocks = soup.find_all('div', class_='block1')
+        return None
+    tree = HTMLParser(content)
+    blocks = tree.css('div.block1')
     movies = []
+    fallback_indices = []
     for b in blocks:
         item = process_movie_block(b)
-        if item:
-            movies.append(item)
+        if not item:
+            continue
+        movie, needs_fallback = item
+        if needs_fallback:
+            fallback_indices.append(len(movies))
+        movies.append(movie)
+
+    # Fetch the fallback titles concurrently; one asyncio.gather over a
+    # multiplexed client costs ~max(RTT) instead of sum(RTT).
+    if fallback_indices:
+        urls = [movies[i]["page_url"] for i in fallback_indices]
+        titles = asyncio.run(_fetch_fallback_titles(urls))
+        for i, title in zip(fallback_indices, titles):
+            movies[i]["title"] = title or "Untitled Movie"
     return movies
 
-@cached(cache=search_movie_cache)
+def _load_movie_listing(url: str) -> list[dict]:
+    movies = _scrape_movie_listing(url)
+    with listing_cache_lock:
+        if movies is None:
+            # Upstream is down or blocking us: degrade gracefully by
+            # serving the last good copy (stale-while-revalidate) and
+            # leave the cache empty so the next request retries.
+            return listing_last_good.get(url, [])
+        listing_cache[url] = movies
+        if movies:
+            listing_last_good[url] = movies
+    return movies
+
+# Single-flight bookkeeping: concurrent requests for the same listing
+# URL on a cache miss join one in-flight load instead of each hitting
+# einthusan and parsing the page themselves.
+LISTING_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+def fetch_movies_by_url(url: str) -> list[dict]:
+    with listing_cache_lock:
+        hit = listing_cache.get(url)
+    if hit is not None:
+        return hit
+
+    with _inflight_lock:
+        future = _inflight.get(url)
+        if future is None:
+            future = _inflight[url] = LISTING_EXECUTOR.submit(_load_movie_listing, url)
+    try:
+        return future.result()
+    finally:
+        with _inflight_lock:
+            _inflight.pop(url, None)
+
+@cached(cache=search_movie_cache, lock=search_movie_cache_lock)
 def search_movie(language: str, movie_title: str) -> list[dict]:
-    lang_code = LANGUAGE_CODES.get(language.lower())
-    if not lang_code:
+    lang_code = language.lower()
+    if lang_code not in LANGUAGES:
         return []
-    url = f"https://einthusan.tv/movie/results/?lang={lang_code}&query={quote_plus(movie_title)}"
+    url = SEARCH_URLS[lang_code] % quote_plus(movie_title)
     return fetch_movies_by_url(url)
 
-# --- NEW: Add a try-except block for robust error handling ---
+# The player markup is stable enough that one regex over the raw bytes
+# beats building a tree just to read a single attribute.
+VIDEO_LINK_RE = re.compile(rb'data-mp4-link="([^"]+)"')
+VIDEO_LINK_SEARCH = VIDEO_LINK_RE.search
+
+def _video_url_from_content(content: bytes) -> str | None:
+    # Error pages and bot walls don't contain the attribute at all;
+    # bail on those with a vectorized substring scan before invoking
+    # the regex engine.
+    if b'data-mp4-link' not in content:
+        return None
+    m = VIDEO_LINK_SEARCH(content)
+    if not m:
+        return None
+    mp4_link = unescape(m.group(1).decode('ascii', 'ignore'))
+    # partition finds the first "etv" and hands back the tail in one
+    # scan, with no list allocation like split() — and no separate
+    # `in` check needed.
+    tail = mp4_link.partition("etv")[2]
+    if tail:
+        return f"https://cdn1.einthusan.io/etv{tail}"
+    return None
+
 def extract_video_url(page_url: str) -> str | None:
+    with extract_cache_lock:
+        hit = video_url_cache.get(page_url)
+    if hit is not None:
+        return hit
     content = fetch_page(page_url)
     if not content:
         return None
-    
+    video_url = _video_url_from_content(content)
+    if video_url:
+        with extract_cache_lock:
+            video_url_cache[page_url] = video_url
+    return video_url
+
+def parse_watch_page(page_url: str) -> tuple[str | None, str | None]:
+    """Fetch a movie page once and pull out both the title and the
+    video URL — /watch used to build two trees over the same bytes."""
+    with extract_cache_lock:
+        title = title_cache.get(page_url)
+        video_url = video_url_cache.get(page_url)
+    if title is not None and video_url is not None:
+        return title, video_url
+    content = fetch_page(page_url)
+    if not content:
+        return None, None
     try:
-        soup = BeautifulSoup(content, 'html.parser')
-        player = soup.find(id="UIVideoPlayer")
-        if player:
-            mp4_link = player.get('data-mp4-link')
-            if mp4_link and "etv" in mp4_link:
-                tail = mp4_link.split("etv", 1)[1]
-                return f"https://cdn1.einthusan.io/etv{tail}"
+        title = extract_title_from_content(content)
+        video_url = _video_url_from_content(content)
+        with extract_cache_lock:
+            if title:
+                title_cache[page_url] = title
+            if video_url:
+                video_url_cache[page_url] = video_url
+        return title, video_url
     except Exception as e:
-        print(f"Error extracting video URL from {page_url}: {e}")
-        return None
-    
-    return None
+        print(f"Error parsing watch page {page_url}: {e}")
+        return None, None
 
 # --- NEW: Function to pre-load caches on startup ---
 def preload_caches():
@@ -215,12 +570,12 @@ def preload_caches():
     print("--- Pre-loading initial movie data into cache ---")
     # Give the server a moment to start before we fire off requests
     time.sleep(2)
-    for lang_name, lang_code in LANGUAGE_CODES.items():
+    for lang_code in LANGUAGE_CHOICES:
         for page in [1]: # Only fetch the first page
-            url = f"https://einthusan.tv/movie/results/?find=Recent&lang={lang_code}&page={page}"
-            print(f"Caching recent movies for '{lang_name}' (page {page})...")
+            url = RECENT_URLS[lang_code] % page
+            print(f"Caching recent movies for '{lang_code}' (page {page})...")
             try:
-                # This call will populate the cache due to the @cached decorator
+                # Populates listing_cache via the single-flight load path
                 fetch_movies_by_url(url)
                 # Small delay to be polite to the server
                 time.sleep(0.5)
@@ -251,11 +606,8 @@ def language_page(language):
     if not corrected:
         return jsonify({"error": "Invalid language"}), 400
 
-    lang_code = LANGUAGE_CODES[corrected]
-    if category == "popular":
-        url = f"https://einthusan.tv/movie/results/?find=Popularity&lang={lang_code}&ptype=view&tp=alltime&page={page}"
-    else:  # recent (default)
-        url = f"https://einthusan.tv/movie/results/?find=Recent&lang={lang_code}&page={page}"
+    templates = POPULAR_URLS if category == "popular" else RECENT_URLS
+    url = templates[corrected] % page
 
     movies = fetch_movies_by_url(url)
     return jsonify({
@@ -288,16 +640,15 @@ def watch():
 
     if movie_title_from_url:
         title = unquote(movie_title_from_url)
+        video_url = extract_video_url(movie_url)
     else:
-        title = get_title_from_movie_page(movie_url)
-        if title:
-            title = clean_title(title)
+        # One fetch + one parse covers both extractions.
+        title, video_url = parse_watch_page(movie_url)
 
     if not title or looks_like_code(title):
         title = "Unknown"
 
-    video_url = extract_video_url(movie_url)
-    
+
     if not video_url:
         return jsonify({"error": "Failed to extract video URL from the page."}), 500
 
@@ -0,0 +1,15 @@
+"""Gunicorn config for production.
+
+Every endpoint spends most of its time waiting on einthusan.tv, so
+threaded workers buy real concurrency without an async rewrite:
+4 processes x 8 threads = 32 in-flight requests.
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+bind = "0.0.0.0:5000"
+workers = 4
+worker_class = "gthread"
+threads = 8
+timeout = 60
+keepalive = 5